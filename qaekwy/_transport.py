@@ -0,0 +1,116 @@
+"""Engine Transport Module
+
+This module provides the HTTP plumbing shared by the engine classes: the
+pooled session retrying transient failures, and the encoding and decoding
+of the JSON bodies, relying on `orjson` when it is installed.
+
+Functions:
+    new_session() -> requests.Session: Creates a pooled HTTP session.
+    base_url(endpoint: str) -> str: Returns the base URL of the commands.
+    decode_json(response: requests.Response): Decodes the JSON body of a response.
+    encode_json(content) -> Union[str, bytes]: Encodes a request body as JSON.
+
+"""
+
+import json
+from typing import Union
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Transient failures are retried with a short exponential backoff, ignoring
+# any Retry-After header so that a call is never blocked for as long as the
+# server asks. Stalled reads are not retried, since each attempt may already
+# have waited for the whole timeout. Responses are only retried for idempotent
+# methods, so a model submission (POST) is never sent twice. Once retries are
+# exhausted, the last response is returned as before.
+RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status_forcelist=(502, 503, 504),
+    backoff_factor=0.25,
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
+def new_session() -> requests.Session:
+    """
+    Create an HTTP session keeping its connections to the engine alive, so that
+    consecutive actions reuse them instead of opening a new connection each,
+    and retrying transient failures.
+
+    Returns:
+        requests.Session: The session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=50, max_retries=RETRY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def base_url(endpoint: str) -> str:
+    """
+    Return the endpoint URL with a trailing slash, ready to be joined with a command.
+
+    Args:
+        endpoint (str): The endpoint URL of the optimization engine.
+
+    Returns:
+        str: The base URL of the commands.
+    """
+    return endpoint if endpoint.endswith("/") else endpoint + "/"
+
+
+def decode_json(response: requests.Response):
+    """
+    Decode the JSON body of a response, straight from its bytes, relying on
+    `orjson` when it is installed.
+
+    Args:
+        response (requests.Response): The response from the optimization engine.
+
+    Returns:
+        The decoded JSON content.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON, as
+        with `Response.json()`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)  # pylint: disable=no-member
+        except orjson.JSONDecodeError as exc:  # pylint: disable=no-member
+            raise requests.exceptions.JSONDecodeError(
+                exc.msg, exc.doc, exc.pos
+            ) from exc
+    return response.json()
+
+
+def encode_json(content) -> Union[str, bytes]:
+    """
+    Encode a request body as JSON, relying on `orjson` when it is installed.
+
+    Args:
+        content: The content to encode.
+
+    Returns:
+        Union[str, bytes]: The JSON-encoded body.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)  # pylint: disable=no-member
+    return json.dumps(content)
+
+
+# Session used by the actions created without one.
+SESSION = new_session()
@@ -76,9 +76,11 @@ Note:
 """
 
 from abc import ABC, abstractmethod
+from typing import Union
 
-import json
 import requests
+
+from qaekwy._transport import SESSION, base_url, decode_json, encode_json, new_session
 from qaekwy.model import DIRECTENGINE_API_ENDPOINT
 from qaekwy.model.modeller import Modeller
 
@@ -107,19 +109,28 @@ class AbstractAction(ABC):
         action(): Abstract method to be implemented by concrete action classes.
     """
 
-    def __init__(self, endpoint: str, command: str, body: str = None) -> None:
+    def __init__(
+        self,
+        endpoint: str,
+        command: str,
+        body: Union[str, bytes] = None,
+        session: requests.Session = None,
+    ) -> None:
         """
         Initialize an AbstractAction instance.
 
         Args:
             endpoint (str): The endpoint URL of the optimization engine.
             command (str): The command to be executed on the engine.
-            body (str): The optional body of the request (default is None).
+            body (Union[str, bytes]): The optional body of the request (default is None).
+            session (requests.Session): The optional HTTP session used to send the
+            request (default is a session shared by the module).
         """
         super().__init__()
         self.endpoint = endpoint
         self.command = command
         self.body = body
+        self.session = SESSION if session is None else session
 
     def execute(self) -> requests.Response:
         """
@@ -134,16 +145,12 @@ class AbstractAction(ABC):
         if len(self.endpoint) < 6:
             return None
 
-        request_line = self.endpoint
-        if self.endpoint[len(self.endpoint) - 1] != "/":
-            request_line = request_line + "/" + self.command
-        else:
-            request_line = request_line + self.command
+        request_line = base_url(self.endpoint) + self.command
 
         if self.body is None:
-            res = requests.get(request_line, timeout=30)
+            res = self.session.get(request_line, timeout=30)
         else:
-            res = requests.post(request_line, self.body, timeout=30)
+            res = self.session.post(request_line, self.body, timeout=30)
 
         return res
 
@@ -190,7 +197,7 @@ class EchoAction(AbstractAction):
         if res is None:
             return None
 
-        return EchoResponse(str(res.content))
+        return EchoResponse(res.text)
 
 
 class VersionAction(AbstractAction):
@@ -224,7 +231,7 @@ class VersionAction(AbstractAction):
         if res is None:
             return None
 
-        return VersionResponse(res.json())
+        return VersionResponse(decode_json(res))
 
 
 class ResetAction(AbstractAction):
@@ -258,7 +265,7 @@ class ResetAction(AbstractAction):
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class StopAction(AbstractAction):
@@ -292,7 +299,7 @@ class StopAction(AbstractAction):
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class StatusAction(AbstractAction):
@@ -326,7 +333,7 @@ class StatusAction(AbstractAction):
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class ModelAction(AbstractAction):
@@ -346,7 +353,7 @@ class ModelAction(AbstractAction):
         Args:
             endpoint (str): The endpoint URL of the optimization engine.
         """
-        super().__init__(endpoint, "model", json.dumps(model.to_json()))
+        super().__init__(endpoint, "model", model.dumps())
 
     def action(self) -> StatusResponse:
         """
@@ -361,7 +368,7 @@ class ModelAction(AbstractAction):
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class DirectModelAction(AbstractAction):
@@ -383,7 +390,7 @@ class DirectModelAction(AbstractAction):
         Args:
             endpoint (str): The endpoint URL of the optimization engine.
         """
-        super().__init__(endpoint, "model", json.dumps(model.to_json()))
+        super().__init__(endpoint, "model", model.dumps())
 
     def action(self) -> SolutionResponse:
         """
@@ -397,7 +404,7 @@ class DirectModelAction(AbstractAction):
         if res is None:
             return None
 
-        return SolutionResponse(res.json())
+        return SolutionResponse(decode_json(res))
 
 
 class CurrentModelAction(AbstractAction):
@@ -432,7 +439,7 @@ class CurrentModelAction(AbstractAction):
         if res is None:
             return None
 
-        return ModelJSonResponse(res.json())
+        return ModelJSonResponse(decode_json(res))
 
 
 class SolutionAction(AbstractAction):
@@ -466,7 +473,7 @@ class SolutionAction(AbstractAction):
         if res is None:
             return None
 
-        return SolutionResponse(res.json())
+        return SolutionResponse(decode_json(res))
 
 
 class Engine:
@@ -486,6 +493,7 @@ class Engine:
         model(model: Modeller): Submit a model to the engine for optimization.
         current_model(): Retrieve the current model from the engine.
         solution(): Retrieve the solution from the engine.
+        close(): Close the HTTP connections held by the engine.
     """
 
     def __init__(self, endpoint: str) -> None:
@@ -496,6 +504,38 @@ class Engine:
             endpoint (str): The endpoint URL of the optimization engine.
         """
         self.endpoint = endpoint
+        self._session = new_session()
+
+    @property
+    def endpoint(self) -> str:
+        """
+        The endpoint URL of the optimization engine.
+        """
+        return self._endpoint
+
+    @endpoint.setter
+    def endpoint(self, endpoint: str) -> None:
+        self._endpoint = endpoint
+        self._base = base_url(endpoint)
+
+    def _run(self, action: AbstractAction):
+        """
+        Run an action through the HTTP session of the engine.
+
+        Args:
+            action (AbstractAction): The action to run.
+
+        Returns:
+            AbstractResponse: The response from the optimization engine.
+        """
+        action.session = self._session
+        return action.action()
+
+    def close(self) -> None:
+        """
+        Close the HTTP connections held by the engine.
+        """
+        self._session.close()
 
     def echo(self):
         """
@@ -504,7 +544,7 @@ class Engine:
         Returns:
             EchoResponse: The echo response from the optimization engine.
         """
-        return EchoAction(self.endpoint).action()
+        return self._run(EchoAction(self._base))
 
     def version(self):
         """
@@ -513,7 +553,7 @@ class Engine:
         Returns:
             VersionResponse: The version response from the optimization engine.
         """
-        return VersionAction(self.endpoint).action()
+        return self._run(VersionAction(self._base))
 
     def reset(self):
         """
@@ -522,7 +562,7 @@ class Engine:
         Returns:
             StatusResponse: The status response from the optimization engine.
         """
-        return ResetAction(self.endpoint).action()
+        return self._run(ResetAction(self._base))
 
     def stop(self):
         """
@@ -531,7 +571,7 @@ class Engine:
         Returns:
             StatusResponse: The status response from the optimization engine.
         """
-        return StopAction(self.endpoint).action()
+        return self._run(StopAction(self._base))
 
     def status(self):
         """
@@ -540,7 +580,7 @@ class Engine:
         Returns:
             StatusResponse: The status response from the optimization engine.
         """
-        return StatusAction(self.endpoint).action()
+        return self._run(StatusAction(self._base))
 
     def model(self, model: Modeller):
         """
@@ -552,7 +592,7 @@ class Engine:
         Returns:
             ModelJSonResponse: The model submission response from the optimization engine.
         """
-        return ModelAction(self.endpoint, model).action()
+        return self._run(ModelAction(self._base, model))
 
     def current_model(self):
         """
@@ -561,7 +601,7 @@ class Engine:
         Returns:
             ModelJSonResponse: The current model response from the optimization engine.
         """
-        return CurrentModelAction(self.endpoint).action()
+        return self._run(CurrentModelAction(self._base))
 
     def solution(self):
         """
@@ -570,7 +610,7 @@ class Engine:
         Returns:
             SolutionResponse: The solution response from the optimization engine.
         """
-        return SolutionAction(self.endpoint).action()
+        return self._run(SolutionAction(self._base))
 
 
 class DirectEngine:
@@ -586,6 +626,7 @@ class DirectEngine:
         version(): Request the version information of the engine.
         model(model: Modeller): Submit a model to the engine for optimization and
         receive the solution, if any.
+        close(): Close the HTTP connections held by the engine.
     """
 
     def __init__(self) -> None:
@@ -596,6 +637,38 @@ class DirectEngine:
             endpoint (str): The endpoint URL of the optimization engine.
         """
         self.endpoint = DIRECTENGINE_API_ENDPOINT
+        self._session = new_session()
+
+    @property
+    def endpoint(self) -> str:
+        """
+        The endpoint URL of the optimization engine.
+        """
+        return self._endpoint
+
+    @endpoint.setter
+    def endpoint(self, endpoint: str) -> None:
+        self._endpoint = endpoint
+        self._base = base_url(endpoint)
+
+    def _run(self, action: AbstractAction):
+        """
+        Run an action through the HTTP session of the engine.
+
+        Args:
+            action (AbstractAction): The action to run.
+
+        Returns:
+            AbstractResponse: The response from the optimization engine.
+        """
+        action.session = self._session
+        return action.action()
+
+    def close(self) -> None:
+        """
+        Close the HTTP connections held by the engine.
+        """
+        self._session.close()
 
     def echo(self):
         """
@@ -604,7 +677,7 @@ class DirectEngine:
         Returns:
             EchoResponse: The echo response from the optimization engine.
         """
-        return EchoAction(self.endpoint).action()
+        return self._run(EchoAction(self._base))
 
     def version(self):
         """
@@ -613,7 +686,7 @@ class DirectEngine:
         Returns:
             VersionResponse: The version response from the optimization engine.
         """
-        return VersionAction(self.endpoint).action()
+        return self._run(VersionAction(self._base))
 
     def model(self, model: Modeller):
         """
@@ -625,7 +698,7 @@ class DirectEngine:
         Returns:
             ModelJSonResponse: The model submission response from the optimization engine.
         """
-        return DirectModelAction(self.endpoint, model).action()
+        return self._run(DirectModelAction(self._base, model))
 
 
 ###
@@ -658,7 +731,7 @@ class CurrentExplainAction(
         if ret is None:
             return None
 
-        return ExplanationResponse(json.loads(str(ret.content)))
+        return ExplanationResponse(decode_json(ret))
 
 
 class ExplainAction(AbstractAction):  # pylint: disable=too-few-public-methods
@@ -668,7 +741,7 @@ class ExplainAction(AbstractAction):  # pylint: disable=too-few-public-methods
 
     def __init__(self, endpoint: str, model: Modeller) -> None:
         super().__init__(
-            endpoint=endpoint, command="explain", body=str(model.to_json())
+            endpoint=endpoint, command="explain", body=model.dumps()
         )
 
     def action(self) -> ExplanationResponse:
@@ -680,7 +753,7 @@ class ExplainAction(AbstractAction):  # pylint: disable=too-few-public-methods
         if res is None:
             return None
 
-        return ExplanationResponse(res.json())
+        return ExplanationResponse(decode_json(res))
 
 
 class CleanAction(AbstractAction):
@@ -700,7 +773,7 @@ class CleanAction(AbstractAction):
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class ClusterStatusAction(AbstractAction):
@@ -731,7 +804,7 @@ class RemoveNodeAction(AbstractAction):  # pylint: disable=too-few-public-method
         super().__init__(
             endpoint=endpoint,
             command="remove",
-            body=json.dumps({"identifier": identifier}),
+            body=encode_json({"identifier": identifier}),
         )
 
     def action(self) -> StatusResponse:
@@ -743,7 +816,7 @@ class RemoveNodeAction(AbstractAction):  # pylint: disable=too-few-public-method
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class EnableNodeAction(AbstractAction):  # pylint: disable=too-few-public-methods
@@ -755,7 +828,7 @@ class EnableNodeAction(AbstractAction):  # pylint: disable=too-few-public-method
         super().__init__(
             endpoint=endpoint,
             command="enable",
-            body=json.dumps({"identifier": identifier}),
+            body=encode_json({"identifier": identifier}),
         )
 
     def action(self) -> StatusResponse:
@@ -767,7 +840,7 @@ class EnableNodeAction(AbstractAction):  # pylint: disable=too-few-public-method
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class DisableNodeAction(AbstractAction):  # pylint: disable=too-few-public-methods
@@ -779,7 +852,7 @@ class DisableNodeAction(AbstractAction):  # pylint: disable=too-few-public-metho
         super().__init__(
             endpoint=endpoint,
             command="disable",
-            body=json.dumps({"identifier": identifier}),
+            body=encode_json({"identifier": identifier}),
         )
 
     def action(self) -> StatusResponse:
@@ -791,7 +864,7 @@ class DisableNodeAction(AbstractAction):  # pylint: disable=too-few-public-metho
         if res is None:
             return None
 
-        return StatusResponse(res.json())
+        return StatusResponse(decode_json(res))
 
 
 class ClusterEngine(Engine):
@@ -819,7 +892,7 @@ class ClusterEngine(Engine):
         Returns:
             ExplanationResponse: The response containing the current explanation.
         """
-        return CurrentExplainAction(self.endpoint).action()
+        return self._run(CurrentExplainAction(self._base))
 
     def explain(self, model: Modeller):
         """
@@ -831,7 +904,7 @@ class ClusterEngine(Engine):
         Returns:
             ExplanationResponse: The response containing the explanation for the model.
         """
-        return ExplainAction(self.endpoint, model).action()
+        return self._run(ExplainAction(self._base, model))
 
     def clean(self):
         """
@@ -840,7 +913,7 @@ class ClusterEngine(Engine):
         Returns:
             StatusResponse: The response indicating the success of the clean operation.
         """
-        return CleanAction(self.endpoint).action()
+        return self._run(CleanAction(self._base))
 
     def status(self):
         """
@@ -849,7 +922,7 @@ class ClusterEngine(Engine):
         Returns:
             ClusterStatusResponse: The response containing the cluster's health status.
         """
-        return ClusterStatusAction(self.endpoint).action()
+        return self._run(ClusterStatusAction(self._base))
 
     def remove_node(self, identifier: str):
         """
@@ -861,7 +934,7 @@ class ClusterEngine(Engine):
         Returns:
             StatusResponse: The response indicating the success of the node removal.
         """
-        return RemoveNodeAction(self, identifier).action
+        return self._run(RemoveNodeAction(self._base, identifier))
 
     def disable_node(self, identifier: str):
         """
@@ -873,7 +946,7 @@ class ClusterEngine(Engine):
         Returns:
             StatusResponse: The response indicating the success of disabling the node.
         """
-        return DisableNodeAction(self, identifier).action
+        return self._run(DisableNodeAction(self._base, identifier))
 
     def enable_node(self, identifier: str):
         """
@@ -885,4 +958,4 @@ class ClusterEngine(Engine):
         Returns:
             StatusResponse: The response indicating the success of enabling the node.
         """
-        return EnableNodeAction(self, identifier).action
+        return self._run(EnableNodeAction(self._base, identifier))
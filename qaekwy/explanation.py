@@ -27,6 +27,28 @@ class Explanation:
 
     def __init__(self, explanation_content: list) -> None:
         self.explanation_content = explanation_content
+        self._explanations = None
+
+    def _by_type(self) -> dict:
+        """
+        Split the explanation content by element type, in a single pass
+        computed on first use.
+
+        Returns:
+            dict: The variable ("var") and constraint ("constraint") explanations.
+        """
+        if self._explanations is None:
+            explanations = {"var": {}, "constraint": {}}
+            for element in self.explanation_content:
+                element_type = element["type"]
+                dico_final = explanations.get(element_type)
+                if dico_final is not None:
+                    dico_final[element["name"]] = {
+                        "type": element_type,
+                        "explanation": element["explanation"],
+                    }
+            self._explanations = explanations
+        return self._explanations
 
     def get_variables(self) -> dict:
         """
@@ -35,20 +57,11 @@ class Explanation:
         Returns:
             dict: A dictionary containing variable explanations with variable names as keys.
 
-        """
-        dico_final = {}
-        for element in self.explanation_content:
-            variable_name = element["name"]
-            variable_type = element["type"]
-            variable_expl = element["explanation"]
-
-            if element["type"] == "var":
-                dico_final[variable_name] = {
-                    "type": variable_type,
-                    "explanation": variable_expl,
-                }
+        Note:
+            The dictionary is shared between calls and must not be mutated.
 
-        return dico_final
+        """
+        return self._by_type()["var"]
 
     def get_constraints(self) -> dict:
         """
@@ -57,17 +70,8 @@ class Explanation:
         Returns:
             dict: A dictionary containing constraint explanations with constraint names as keys.
 
+        Note:
+            The dictionary is shared between calls and must not be mutated.
+
         """
-        dico_final = {}
-        for element in self.explanation_content:
-            constraint_name = element["name"]
-            constraint_type = element["type"]
-            constraint_expl = element["explanation"]
-
-            if element["type"] == "constraint":
-                dico_final[constraint_name] = {
-                    "type": constraint_type,
-                    "explanation": constraint_expl,
-                }
-
-        return dico_final
+        return self._by_type()["constraint"]
@@ -0,0 +1,81 @@
+"""Sort Checking Kernels
+
+This module provides the kernels used to check whether concrete values
+satisfy an ascending or descending order, without submitting anything
+to the solver.
+
+When Numba is installed, the kernels are compiled with `numba.njit` and
+run on contiguous NumPy arrays. Otherwise, or when the values do not form
+a numeric array (unassigned `None` values, integers beyond 64 bits...), the
+very same loops run as plain Python over the sequence. NumPy and Numba are only
+imported on the first check, so that building models does not pay for
+their import time.
+
+Functions:
+    is_sorted(values, reverse: bool = False) -> bool:
+        Check whether the values are sorted.
+
+"""
+
+import functools
+
+# NumPy dtype kinds handled by the compiled kernels: booleans, signed and
+# unsigned integers, and floats.
+_NUMERIC_KINDS = "biuf"
+
+
+def _is_sorted_asc(values) -> bool:
+    for i in range(1, len(values)):
+        if values[i] < values[i - 1]:
+            return False
+    return True
+
+
+def _is_sorted_desc(values) -> bool:
+    for i in range(1, len(values)):
+        if values[i] > values[i - 1]:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _kernels() -> tuple:
+    """
+    Return the NumPy module (or None) and the ascending and descending
+    kernels, compiled with Numba when it is installed.
+
+    Returns:
+        tuple: The (numpy, ascending, descending) objects.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional dependency
+        return (None, _is_sorted_asc, _is_sorted_desc)
+    return (
+        np,
+        njit(cache=True)(_is_sorted_asc),
+        njit(cache=True)(_is_sorted_desc),
+    )
+
+
+def is_sorted(values, reverse: bool = False) -> bool:
+    """
+    Check whether the values are sorted.
+
+    Args:
+        values: The concrete values, as a list or a NumPy array.
+        reverse (bool, optional): Whether a descending order is expected.
+
+    Returns:
+        bool: True if the values are in the expected order, False otherwise.
+    """
+    np, ascending, descending = _kernels()
+    if np is not None:
+        array = np.asarray(values)
+        if array.dtype.kind not in _NUMERIC_KINDS:
+            ascending, descending = _is_sorted_asc, _is_sorted_desc
+        else:
+            values = np.ascontiguousarray(array)
+    return bool(descending(values) if reverse else ascending(values))
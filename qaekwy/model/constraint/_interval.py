@@ -0,0 +1,103 @@
+"""Interval Helpers
+
+This module provides small interval arithmetic helpers, used by constraints
+to detect, at construction time, relationships that no assignment of their
+variables' domains can satisfy.
+
+An interval is a `(low, high)` tuple. Helpers return None whenever a bound
+is unknown, in which case no conclusion can be drawn.
+
+Functions:
+    bounds(variable) -> Optional[tuple]: Returns the domain bounds of a variable.
+    intersects(first, second) -> bool: Checks whether two intervals overlap.
+    power_range(base, exponent) -> Optional[tuple]: Returns the range of base ** exponent.
+    modulo_range(dividend, divisor, integral) -> Optional[tuple]:
+        Returns the range of dividend % divisor.
+
+"""
+
+from typing import Optional
+
+
+def bounds(variable) -> Optional[tuple]:
+    """
+    Return the domain bounds of a variable.
+
+    Args:
+        variable: The variable.
+
+    Returns:
+        Optional[tuple]: The (low, high) bounds, or None if any bound is unknown.
+    """
+    low = getattr(variable, "domain_low", None)
+    high = getattr(variable, "domain_high", None)
+    if low is None or high is None:
+        return None
+    return (low, high)
+
+
+def intersects(first: Optional[tuple], second: Optional[tuple]) -> bool:
+    """
+    Check whether two intervals overlap. Unknown intervals always overlap.
+
+    Args:
+        first (Optional[tuple]): The first interval.
+        second (Optional[tuple]): The second interval.
+
+    Returns:
+        bool: False if both intervals are known and disjoint, True otherwise.
+    """
+    if first is None or second is None:
+        return True
+    return first[0] <= second[1] and second[0] <= first[1]
+
+
+def power_range(base: Optional[tuple], exponent) -> Optional[tuple]:
+    """
+    Return the range of `base ** exponent`.
+
+    Args:
+        base (Optional[tuple]): The interval of the base.
+        exponent: The exponent. Only non-negative integers are handled.
+
+    Returns:
+        Optional[tuple]: The (low, high) range, or None if it cannot be computed.
+    """
+    if base is None or not isinstance(exponent, int) or exponent < 0:
+        return None
+    low, high = base
+    candidates = [low**exponent, high**exponent]
+    if low < 0 < high:
+        candidates.append(0)
+    return (min(candidates), max(candidates))
+
+
+def modulo_range(
+    dividend: Optional[tuple], divisor: Optional[tuple], integral: bool = True
+) -> Optional[tuple]:
+    """
+    Return the range of `dividend % divisor`, the result taking the sign of the
+    dividend and being smaller, in absolute value, than the divisor.
+
+    Args:
+        dividend (Optional[tuple]): The interval of the dividend.
+        divisor (Optional[tuple]): The interval of the divisor.
+        integral (bool, optional): Whether all the operands are integers, in
+        which case the result is at most the largest divisor minus one.
+        Otherwise, the largest divisor itself bounds the result.
+
+    Returns:
+        Optional[tuple]: The (low, high) range, or None if it cannot be computed.
+    """
+    if dividend is None or divisor is None:
+        return None
+    largest = min(
+        max(abs(divisor[0]), abs(divisor[1])) - (1 if integral else 0),
+        max(abs(dividend[0]), abs(dividend[1])),
+    )
+    if largest < 0:
+        return None
+    return (
+        -largest if dividend[0] < 0 else 0,
+        largest if dividend[1] > 0 else 0,
+    )
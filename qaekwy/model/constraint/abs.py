@@ -34,6 +34,8 @@ class ConstraintAbs(AbstractConstraint):
 
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new absolute value constraint instance.
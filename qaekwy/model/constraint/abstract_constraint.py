@@ -31,6 +31,8 @@ class AbstractConstraint(ABC):
 
     """
 
+    __slots__ = ("constraint_name",)
+
     def random_constraint_name(self) -> str:
         """
         Generate a random constraint name.
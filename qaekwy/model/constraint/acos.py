@@ -35,6 +35,8 @@ class ConstraintACos(AbstractConstraint):
         acos_constraint = ConstraintACos(var_angle, var_value, "acos_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new arccosine constraint instance.
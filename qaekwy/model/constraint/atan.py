@@ -35,6 +35,8 @@ class ConstraintATan(AbstractConstraint):
         atan_constraint = ConstraintATan(var_angle, var_value, "atan_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new arctangent constraint instance.
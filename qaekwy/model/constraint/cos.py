@@ -35,6 +35,8 @@ class ConstraintCos(AbstractConstraint):
         cos_constraint = ConstraintCos(var_angle, var_value, "cos_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new cosine constraint instance.
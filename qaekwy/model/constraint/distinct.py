@@ -42,6 +42,8 @@ class ConstraintDistinctArray(AbstractConstraint):
         distinct_constraint = ConstraintDistinctArray(array_var, "distinct_array_constraint")
     """
 
+    __slots__ = ("var_1",)
+
     def __init__(self, var_1: ArrayVariable, constraint_name=None) -> None:
         """
         Initialize a new distinct array constraint instance.
@@ -94,6 +96,8 @@ class ConstraintDistinctRow(AbstractConstraint):
         ConstraintDistinctRow(array_var, size=3, idx=1, constraint_name="distinct_row_constraint")
     """
 
+    __slots__ = ("var_1", "size", "idx")
+
     def __init__(
         self, var_1: ArrayVariable, size: int, idx: int, constraint_name=None
     ) -> None:
@@ -154,6 +158,8 @@ class ConstraintDistinctCol(AbstractConstraint):
         ConstraintDistinctCol(array_var, size=3, idx=0, constraint_name="distinct_col_constraint")
     """
 
+    __slots__ = ("var_1", "size", "idx")
+
     def __init__(
         self, var_1: ArrayVariable, size: int, idx: int, constraint_name=None
     ) -> None:
@@ -227,6 +233,15 @@ class ConstraintDistinctSlice(AbstractConstraint):
                 constraint_name="distinct_slice_constraint")
     """
 
+    __slots__ = (
+        "var_1",
+        "size",
+        "offset_start_x",
+        "offset_start_y",
+        "offset_end_x",
+        "offset_end_y",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         var_1: ArrayVariable,
@@ -41,6 +41,8 @@ class ConstraintElement(AbstractConstraint):
             ConstraintElement(mapping_array, variable_1, variable_2, "element_constraint")
     """
 
+    __slots__ = ("map_array", "var_1", "var_2")
+
     def __init__(
         self,
         map_array: ArrayVariable,
@@ -69,10 +71,13 @@ class ConstraintElement(AbstractConstraint):
         Returns:
             dict: A dictionary containing constraint information in JSON format.
         """
+        map_name = self.map_array.var_name
+        v1 = self.var_1.var_name
+        v2 = self.var_2.var_name
         return {
             "name": self.constraint_name,
-            "map": self.map_array.var_name,
-            "v1": self.var_1.var_name,
-            "v2": self.var_2.var_name,
+            "map": map_name,
+            "v1": v1,
+            "v2": v2,
             "type": "element",
         }
@@ -36,6 +36,8 @@ class ConstraintLogarithme(AbstractConstraint):
             ConstraintLogarithme(variable_to_log, result_variable, "logarithmic_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new logarithmic constraint instance.
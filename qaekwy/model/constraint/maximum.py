@@ -37,6 +37,8 @@ class ConstraintMaximum(AbstractConstraint):
         max_constraint = ConstraintMaximum(variable_1, variable_2, variable_3, "max_constraint")
     """
 
+    __slots__ = ("var_1", "var_2", "var_3")
+
     def __init__(
         self, var_1: Variable, var_2: Variable, var_3: Variable, constraint_name=None
     ) -> None:
@@ -61,10 +63,13 @@ class ConstraintMaximum(AbstractConstraint):
         Returns:
             dict: A dictionary containing constraint information in JSON format.
         """
+        v1 = self.var_1.var_name
+        v2 = self.var_2.var_name
+        v3 = self.var_3.var_name
         return {
             "name": self.constraint_name,
-            "v1": self.var_1.var_name,
-            "v2": self.var_2.var_name,
-            "v3": self.var_3.var_name,
+            "v1": v1,
+            "v2": v2,
+            "v3": v3,
             "type": "max",
         }
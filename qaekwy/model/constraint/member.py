@@ -10,10 +10,28 @@ Classes:
 
 """
 
+import functools
+
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
 from qaekwy.model.variable.variable import ArrayVariable, Variable
 
 
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """
+    Import NumPy on first use, so that building models does not pay for its
+    import time.
+
+    Returns:
+        The `numpy` module, or None if it is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
 class ConstraintMember(AbstractConstraint):
     """
     Represents a constraint to enforce a membership relationship between an
@@ -31,6 +49,8 @@ class ConstraintMember(AbstractConstraint):
         var_2 (Variable): The variable to be checked for membership.
 
     Methods:
+        check(array_values, candidate, assume_sorted): Checks whether concrete
+        values satisfy the constraint.
         to_json(): Returns a JSON representation of the constraint.
 
     Example:
@@ -38,6 +58,8 @@ class ConstraintMember(AbstractConstraint):
             ConstraintMember(array_variable, variable_to_check, "member_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(
         self, var_1: ArrayVariable, var_2: Variable, constraint_name=None
     ) -> None:
@@ -53,6 +75,36 @@ class ConstraintMember(AbstractConstraint):
         self.var_1 = var_1
         self.var_2 = var_2
 
+    def check(self, array_values, candidate, assume_sorted: bool = False) -> bool:
+        """
+        Check whether concrete values satisfy the membership constraint.
+
+        This runs locally, without the solver, and can be used to validate a
+        solution before shipping it. When NumPy is installed, a sorted array
+        (e.g. one also constrained by `ConstraintSorted`) is searched with
+        `numpy.searchsorted` in O(log N), and any other array with `numpy.isin`.
+        Without NumPy, a plain membership test is used.
+
+        Args:
+            array_values: The values of the array variable, as a list or a NumPy array.
+            candidate: The value of the variable to be checked for membership.
+            assume_sorted (bool, optional): Whether array_values is known to be
+            sorted in ascending order.
+
+        Returns:
+            bool: True if candidate is a member of array_values, False otherwise.
+        """
+        np = _numpy()
+        if np is None:
+            return candidate in array_values
+
+        array_values = np.asarray(array_values)
+        if assume_sorted:
+            idx = np.searchsorted(array_values, candidate)
+            return bool(idx < array_values.size and array_values[idx] == candidate)
+
+        return bool(np.isin(candidate, array_values))
+
     def to_json(self):
         """
         Convert the constraint to a JSON representation.
@@ -60,9 +112,11 @@ class ConstraintMember(AbstractConstraint):
         Returns:
             dict: A dictionary containing constraint information in JSON format.
         """
+        v1 = self.var_1.var_name
+        v2 = self.var_2.var_name
         return {
             "name": self.constraint_name,
-            "v1": self.var_1.var_name,
-            "v2": self.var_2.var_name,
+            "v1": v1,
+            "v2": v2,
             "type": "member",
         }
@@ -9,8 +9,10 @@ Classes:
 
 """
 
+from qaekwy.exception.model_failure import ModelFailure
+from qaekwy.model.constraint._interval import bounds, intersects, modulo_range
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
-from qaekwy.model.variable.variable import Variable
+from qaekwy.model.variable.variable import Variable, VariableType
 
 
 class ConstraintModulo(AbstractConstraint):
@@ -43,6 +45,8 @@ class ConstraintModulo(AbstractConstraint):
             )
     """
 
+    __slots__ = ("var_1", "var_2", "var_3")
+
     def __init__(
         self, var_1: Variable, var_2: Variable, var_3: Variable, constraint_name=None
     ) -> None:
@@ -54,7 +58,21 @@ class ConstraintModulo(AbstractConstraint):
             var_2 (Variable): The divisor variable in the modulo relationship.
             var_3 (Variable): The result variable of the modulo relationship.
             constraint_name (str, optional): A name for the constraint.
+
+        Raises:
+            ModelFailure: If the domain of var_3 cannot hold any value of var_1 % var_2.
         """
+        integral = all(
+            getattr(var, "var_type", None) is VariableType.INTEGER
+            for var in (var_1, var_2, var_3)
+        )
+        if not intersects(
+            modulo_range(bounds(var_1), bounds(var_2), integral), bounds(var_3)
+        ):
+            raise ModelFailure(
+                f"The domain of '{var_3.var_name}' cannot hold the result of the "
+                "'mod' constraint."
+            )
         super().__init__(constraint_name)
         self.var_1 = var_1
         self.var_2 = var_2
@@ -67,10 +85,13 @@ class ConstraintModulo(AbstractConstraint):
         Returns:
             dict: A dictionary containing constraint information in JSON format.
         """
+        v1 = self.var_1.var_name
+        v2 = self.var_2.var_name
+        v3 = self.var_3.var_name
         return {
             "name": self.constraint_name,
-            "v1": self.var_1.var_name,
-            "v2": self.var_2.var_name,
-            "v3": self.var_3.var_name,
+            "v1": v1,
+            "v2": v2,
+            "v3": v3,
             "type": "mod",
         }
@@ -38,6 +38,8 @@ class ConstraintNRoot(AbstractConstraint):
             ConstraintNRoot(variable_to_root, n_value, result_variable, "nroot_constraint")
     """
 
+    __slots__ = ("var_1", "var_2", "var_3")
+
     def __init__(
         self, var_1: Variable, var_2: int, var_3: Variable, constraint_name=None
     ) -> None:
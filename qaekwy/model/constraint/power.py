@@ -9,6 +9,8 @@ Classes:
 
 """
 
+from qaekwy.exception.model_failure import ModelFailure
+from qaekwy.model.constraint._interval import bounds, intersects, power_range
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
 from qaekwy.model.variable.variable import Variable
 
@@ -38,6 +40,8 @@ class ConstraintPower(AbstractConstraint):
             ConstraintPower(base_variable, exponent_value, result_variable, "power_constraint")
     """
 
+    __slots__ = ("var_1", "var_2", "var_3")
+
     def __init__(
         self, var_1: Variable, var_2: int, var_3: Variable, constraint_name=None
     ) -> None:
@@ -49,7 +53,15 @@ class ConstraintPower(AbstractConstraint):
             var_2 (int): The exponent variable in the power relationship.
             var_3 (Variable): The result variable of the power relationship.
             constraint_name (str, optional): A name for the constraint.
+
+        Raises:
+            ModelFailure: If the domain of var_3 cannot hold any value of var_1 ** var_2.
         """
+        if not intersects(power_range(bounds(var_1), var_2), bounds(var_3)):
+            raise ModelFailure(
+                f"The domain of '{var_3.var_name}' cannot hold the result of the "
+                "'pow' constraint."
+            )
         super().__init__(constraint_name)
         self.var_1 = var_1
         self.var_2 = var_2
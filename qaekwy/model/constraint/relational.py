@@ -35,6 +35,8 @@ class RelationalExpression(AbstractConstraint):
             RelationalExpression(expression, "relational_constraint")
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expression, constraint_name=None) -> None:
         """
         Initialize a new relational expression constraint instance.
@@ -1,57 +1,85 @@
-"""ConstraintSorted and ConstraintReverseSorted Module
+"""ConstraintOrder Module
 
-This module defines the ConstraintSorted and ConstraintReverseSorted classes,
-which represent constraints to enforce sorted and reverse-sorted relationships
-among elements of an array variable.
+This module defines the ConstraintOrder class, which represents a constraint
+to enforce a sorted or reverse-sorted relationship among elements of an array
+variable.
 
 Classes:
-    ConstraintSorted: Represents a constraint to enforce a sorted relationship
-    among elements of an array variable.
+    ConstraintOrder: Represents a constraint to enforce a sorted (or
+    reverse-sorted) relationship among elements of an array variable.
 
-    ConstraintReverseSorted: Represents a constraint to enforce a reverse-sorted
-    relationship among elements of an array variable.
+Functions:
+    ConstraintSorted: Builds a ConstraintOrder enforcing an ascending order.
+    ConstraintReverseSorted: Builds a ConstraintOrder enforcing a descending order.
 
 """
 
+from qaekwy.model.constraint._fast_sort import is_sorted
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
 from qaekwy.model.variable.variable import ArrayVariable
 
 
-class ConstraintSorted(AbstractConstraint):
+class ConstraintOrder(AbstractConstraint):
     """
     Represents a constraint to enforce a sorted relationship among elements
     of an array variable.
 
     This constraint enforces that the elements of the array variable var_1
-    are in ascending sorted order.
+    are in ascending sorted order, or in descending sorted order when
+    `reverse` is set.
 
     Args:
-        var_1 (ArrayVariable): The array variable for which the sorted relationship is enforced.
+        var_1 (ArrayVariable): The array variable for which the order is enforced.
+        reverse (bool, optional): Whether the order is descending. Defaults to False.
         constraint_name (str, optional): A name for the constraint.
 
     Attributes:
-        var_1 (ArrayVariable): The array variable for which the sorted relationship is enforced.
+        var_1 (ArrayVariable): The array variable for which the order is enforced.
+        reverse (bool): Whether the order is descending.
 
     Methods:
+        check(values): Checks whether concrete values satisfy the constraint.
         to_json(): Returns a JSON representation of the constraint.
 
     Example:
         array_to_sort = ArrayVariable("array_to_sort")
-        sorted_constraint = ConstraintSorted(array_to_sort, "sorted_constraint")
+        sorted_constraint = ConstraintOrder(array_to_sort, constraint_name="sorted_constraint")
         constraint_json = sorted_constraint.to_json()
     """
 
-    def __init__(self, var_1: ArrayVariable, constraint_name=None) -> None:
+    __slots__ = ("var_1", "reverse")
+
+    _TAG = ("sorted", "rsorted")
+
+    def __init__(
+        self, var_1: ArrayVariable, reverse: bool = False, constraint_name=None
+    ) -> None:
         """
-        Initialize a new sorted constraint instance.
+        Initialize a new order constraint instance.
 
         Args:
-            var_1 (ArrayVariable): The array variable for which the sorted
-            relationship is enforced.
+            var_1 (ArrayVariable): The array variable for which the order is enforced.
+            reverse (bool, optional): Whether the order is descending.
             constraint_name (str, optional): A name for the constraint.
         """
         super().__init__(constraint_name)
         self.var_1 = var_1
+        self.reverse = bool(reverse)
+
+    def check(self, values) -> bool:
+        """
+        Check whether concrete values of the array variable satisfy the constraint.
+
+        This runs locally, without the solver. The check is compiled with Numba
+        when it is installed.
+
+        Args:
+            values: The values of the array variable, as a list or a NumPy array.
+
+        Returns:
+            bool: True if the values are in the expected order, False otherwise.
+        """
+        return is_sorted(values, self.reverse)
 
     def to_json(self):
         """
@@ -63,56 +91,48 @@ class ConstraintSorted(AbstractConstraint):
         return {
             "name": self.constraint_name,
             "v1": self.var_1.var_name,
-            "type": "sorted",
+            "type": self._TAG[self.reverse],
         }
 
 
-class ConstraintReverseSorted(AbstractConstraint):
+def ConstraintSorted(  # pylint: disable=invalid-name
+    var_1: ArrayVariable, constraint_name=None
+) -> ConstraintOrder:
     """
-    Represents a constraint to enforce a reverse-sorted relationship
-    among elements of an array variable.
-
-    This constraint enforces that the elements of the array variable var_1
-    are in descending sorted order.
+    Create a constraint to enforce an ascending sorted relationship among
+    elements of an array variable.
 
     Args:
-        var_1 (ArrayVariable): The array variable for which the reverse-sorted
+        var_1 (ArrayVariable): The array variable for which the sorted
         relationship is enforced.
         constraint_name (str, optional): A name for the constraint.
 
-    Attributes:
+    Returns:
+        ConstraintOrder: The ascending order constraint.
+
+    Example:
+        sorted_constraint = ConstraintSorted(array_to_sort, "sorted_constraint")
+    """
+    return ConstraintOrder(var_1, False, constraint_name)
+
+
+def ConstraintReverseSorted(  # pylint: disable=invalid-name
+    var_1: ArrayVariable, constraint_name=None
+) -> ConstraintOrder:
+    """
+    Create a constraint to enforce a descending sorted relationship among
+    elements of an array variable.
+
+    Args:
         var_1 (ArrayVariable): The array variable for which the reverse-sorted
         relationship is enforced.
+        constraint_name (str, optional): A name for the constraint.
 
-    Methods:
-        to_json(): Returns a JSON representation of the constraint.
+    Returns:
+        ConstraintOrder: The descending order constraint.
 
     Example:
         reverse_sorted_constraint =
             ConstraintReverseSorted(array_to_reverse_sort, "reverse_sorted_constraint")
     """
-
-    def __init__(self, var_1: ArrayVariable, constraint_name=None) -> None:
-        """
-        Initialize a new reverse-sorted constraint instance.
-
-        Args:
-            var_1 (ArrayVariable): The array variable for which the reverse-sorted
-            relationship is enforced.
-            constraint_name (str, optional): A name for the constraint.
-        """
-        super().__init__(constraint_name)
-        self.var_1 = var_1
-
-    def to_json(self):
-        """
-        Convert the constraint to a JSON representation.
-
-        Returns:
-            dict: A dictionary containing constraint information in JSON format.
-        """
-        return {
-            "name": self.constraint_name,
-            "v1": self.var_1.var_name,
-            "type": "rsorted",
-        }
+    return ConstraintOrder(var_1, True, constraint_name)
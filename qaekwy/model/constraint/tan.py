@@ -35,6 +35,8 @@ class ConstraintTan(AbstractConstraint):
             ConstraintTan(variable_to_tangent, result_variable, "tangent_constraint")
     """
 
+    __slots__ = ("var_1", "var_2")
+
     def __init__(self, var_1: Variable, var_2: Variable, constraint_name=None) -> None:
         """
         Initialize a new tangent constraint instance.
@@ -36,7 +36,7 @@ def maximum(expr: ExpressionArray) -> Expression:
     Returns:
         Expression: An expression representing the maximum value.
     """
-    return Expression(f"max({expr})")
+    return Expression.compose("max(", expr, ")")
 
 
 def minimum(expr: ExpressionArray) -> Expression:
@@ -49,7 +49,7 @@ def minimum(expr: ExpressionArray) -> Expression:
     Returns:
         Expression: An expression representing the minimum value.
     """
-    return Expression(f"min({expr})")
+    return Expression.compose("min(", expr, ")")
 
 
 def sum_of(expr: ExpressionArray) -> Expression:
@@ -62,7 +62,7 @@ def sum_of(expr: ExpressionArray) -> Expression:
     Returns:
         Expression: An expression representing the sum.
     """
-    return Expression(f"sum({expr})")
+    return Expression.compose("sum(", expr, ")")
 
 
 def absolute(expr: Expression) -> Expression:
@@ -75,7 +75,7 @@ def absolute(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the absolute value.
     """
-    return Expression(f"abs({expr})")
+    return Expression.compose("abs(", expr, ")")
 
 
 def power(expr: Expression, val) -> Expression:
@@ -90,7 +90,7 @@ def power(expr: Expression, val) -> Expression:
         Expression: An expression representing the exponentiation result.
     """
 
-    return Expression(f"pow({expr}, {val})")
+    return Expression.compose("pow(", expr, ", ", val, ")")
 
 
 def nroot(expr: Expression, val) -> Expression:
@@ -104,7 +104,7 @@ def nroot(expr: Expression, val) -> Expression:
     Returns:
         Expression: An expression representing the nth root result.
     """
-    return Expression(f"nroot({expr}, {val})")
+    return Expression.compose("nroot(", expr, ", ", val, ")")
 
 
 def sqr(expr: Expression) -> Expression:
@@ -117,7 +117,7 @@ def sqr(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the square.
     """
-    return Expression(f"sqr({expr})")
+    return Expression.compose("sqr(", expr, ")")
 
 
 def sqrt(expr: Expression) -> Expression:
@@ -130,7 +130,7 @@ def sqrt(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the square root.
     """
-    return Expression(f"sqrt({expr})")
+    return Expression.compose("sqrt(", expr, ")")
 
 
 def sin(expr: Expression) -> Expression:
@@ -143,7 +143,7 @@ def sin(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the sine value.
     """
-    return Expression(f"sin({expr})")
+    return Expression.compose("sin(", expr, ")")
 
 
 def cos(expr: Expression) -> Expression:
@@ -156,7 +156,7 @@ def cos(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the cosine value.
     """
-    return Expression(f"cos({expr})")
+    return Expression.compose("cos(", expr, ")")
 
 
 def tan(expr: Expression) -> Expression:
@@ -169,7 +169,7 @@ def tan(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the tangent value.
     """
-    return Expression(f"tan({expr})")
+    return Expression.compose("tan(", expr, ")")
 
 
 def asin(expr: Expression) -> Expression:
@@ -182,7 +182,7 @@ def asin(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the arcsine value.
     """
-    return Expression(f"asin({expr})")
+    return Expression.compose("asin(", expr, ")")
 
 
 def acos(expr: Expression) -> Expression:
@@ -195,7 +195,7 @@ def acos(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the arccosine value.
     """
-    return Expression(f"acos({expr})")
+    return Expression.compose("acos(", expr, ")")
 
 
 def atan(expr: Expression) -> Expression:
@@ -208,7 +208,7 @@ def atan(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the arctangent value.
     """
-    return Expression(f"atan({expr})")
+    return Expression.compose("atan(", expr, ")")
 
 
 def log(expr: Expression) -> Expression:
@@ -221,7 +221,7 @@ def log(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the natural logarithm value.
     """
-    return Expression(f"log({expr})")
+    return Expression.compose("log(", expr, ")")
 
 
 def exp(expr: Expression) -> Expression:
@@ -234,4 +234,4 @@ def exp(expr: Expression) -> Expression:
     Returns:
         Expression: An expression representing the exponential function value.
     """
-    return Expression(f"exp({expr})")
+    return Expression.compose("exp(", expr, ")")
@@ -11,7 +11,7 @@ Methods:
     add_constraint(constraint: Union[AbstractConstraint, Expression]) -> Modeller:
         Adds a constraint to the optimization model.
 
-    add_objective(objective: Union[SpecificMinimum, SpecificMaximum]) -> Modeller:
+    add_objective(objective: SpecificObjective) -> Modeller:
         Adds an objective to the optimization model.
 
     set_searcher(searcher: SearcherType) -> Modeller:
@@ -26,20 +26,78 @@ Methods:
     to_json() -> dict:
         Converts the optimization model to a JSON representation.
 
+    dumps() -> bytes:
+        Serializes the optimization model to JSON-encoded bytes.
+
+    dump(fp) -> None:
+        Serializes the optimization model as JSON into a text file-like object.
+
 Note:
     Refer to the individual method documentation for more details about their usage.
 
 """
 
+import json
+import math
+import operator
+from itertools import chain, compress, repeat
 from typing import Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from qaekwy.exception.model_failure import ModelFailure
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
 from qaekwy.model.constraint.relational import RelationalExpression
 from qaekwy.model.cutoff import Cutoff
 from qaekwy.model.searcher import SearcherType
-from qaekwy.model.specific import SpecificMaximum, SpecificMinimum
+from qaekwy.model.specific import SpecificObjective
 from qaekwy.model.variable.variable import ArrayVariable, Expression, Variable
 
+_to_json = operator.methodcaller("to_json")
+
+_CONTAINERS = frozenset((dict, list))
+
+
+def _has_non_finite(document) -> bool:
+    """
+    Check whether a JSON document holds a non-finite float (NaN or infinity).
+
+    The document is scanned one nesting level at a time, with the iteration
+    left to built-in functions, as it is done on every `Modeller.dumps` call.
+
+    Args:
+        document: The JSON document, made of dicts, lists and scalar values.
+
+    Returns:
+        bool: True if the document holds a non-finite float, False otherwise.
+    """
+    level = [document]
+    while level:
+        types = list(map(type, level))
+        values = list(
+            chain(
+                chain.from_iterable(
+                    map(dict.values, compress(level, map(operator.is_, types, repeat(dict))))
+                ),
+                chain.from_iterable(compress(level, map(operator.is_, types, repeat(list)))),
+            )
+        )
+        types = list(map(type, values))
+        kinds = set(types)
+        if float in kinds and not all(
+            map(math.isfinite, compress(values, map(operator.is_, types, repeat(float))))
+        ):
+            return True
+        level = (
+            list(compress(values, map(_CONTAINERS.__contains__, types)))
+            if kinds & _CONTAINERS
+            else None
+        )
+    return False
+
 
 class Modeller:
     """
@@ -48,7 +106,7 @@ class Modeller:
     Attributes:
         constraint_list (list[AbstractConstraint]): A list of constraints.
         variable_list (list[Union[Variable, ArrayVariable]]): A list of variables.
-        objective_list (list[Union[SpecificMinimum, SpecificMaximum]]): A list of objectives.
+        objective_list (list[SpecificObjective]): A list of objectives.
         searcher (SearcherType): The type of searcher to be used for optimization.
         cutoff (Cutoff): The cutoff condition for stopping the optimization.
         callback_url (str): The URL to which the optimization callback will be sent.
@@ -56,14 +114,25 @@ class Modeller:
     Methods:
         add_variable(variable: Union[Variable, ArrayVariable]): Add a variable to the model.
         add_constraint(constraint: Union[AbstractConstraint, Expression]): Add a constraint to the model.
-        add_objective(objective: Union[SpecificMinimum, SpecificMaximum]): Add an objective.
+        add_objective(objective: SpecificObjective): Add an objective.
         set_searcher(searcher: SearcherType): Set the searcher type for optimization.
         set_cutoff(cutoff: Cutoff): Set the cutoff condition for optimization.
         set_callback_url(callback_url: str): Set the callback URL for optimization.
         to_json() -> dict: Convert the modeller and its components to a JSON representation.
+        dumps() -> bytes: Serialize the modeller to JSON-encoded bytes.
+        dump(fp): Serialize the modeller as JSON into a text file-like object.
 
     """
 
+    __slots__ = (
+        "constraint_list",
+        "variable_list",
+        "objective_list",
+        "searcher",
+        "cutoff",
+        "callback_url",
+    )
+
     def __init__(self) -> None:
         """
         Initialize a Modeller instance.
@@ -85,7 +154,8 @@ class Modeller:
         Returns:
             Modeller: The modeller instance for method chaining.
         """
-        self.variable_list.append(variable)
+        if variable is not None:
+            self.variable_list.append(variable)
         return self
 
     def add_constraint(self, constraint: Union[AbstractConstraint, Expression]):
@@ -98,24 +168,26 @@ class Modeller:
         Returns:
             Modeller: The modeller instance for method chaining.
         """
-        self.constraint_list.append(
-            RelationalExpression(constraint)
-            if isinstance(constraint, Expression)
-            else constraint
-        )
+        if constraint is not None:
+            self.constraint_list.append(
+                RelationalExpression(constraint)
+                if isinstance(constraint, Expression)
+                else constraint
+            )
         return self
 
-    def add_objective(self, objective: Union[SpecificMinimum, SpecificMaximum]):
+    def add_objective(self, objective: SpecificObjective):
         """
         Add an objective to the model.
 
         Args:
-            objective (Union[SpecificMinimum, SpecificMaximum]): The objective to be added.
+            objective (SpecificObjective): The objective to be added.
 
         Returns:
             Modeller: The modeller instance for method chaining.
         """
-        self.objective_list.append(objective)
+        if objective is not None:
+            self.objective_list.append(objective)
         return self
 
     def set_searcher(self, searcher: SearcherType):
@@ -173,17 +245,9 @@ class Modeller:
 
         res["searcher"] = self.searcher.value
 
-        res["var"] = []
-        for var_elem in self.variable_list:
-            res["var"].append(var_elem.to_json())
-
-        res["constraint"] = []
-        for constraint_elem in self.constraint_list:
-            res["constraint"].append(constraint_elem.to_json())
-
-        res["specific"] = []
-        for specific_elem in self.objective_list:
-            res["specific"].append(specific_elem.to_json())
+        res["var"] = list(map(_to_json, self.variable_list))
+        res["constraint"] = list(map(_to_json, self.constraint_list))
+        res["specific"] = list(map(_to_json, self.objective_list))
 
         if self.cutoff is not None:
             res[
@@ -196,3 +260,35 @@ class Modeller:
         res["solution_limit"] = 1
 
         return res
+
+    def dumps(self) -> bytes:
+        """
+        Serialize the modeller and its components to JSON-encoded bytes.
+
+        The serialization relies on `orjson` when it is installed, and on the
+        standard `json` module otherwise. As `orjson` encodes non-finite floats as
+        `null` and rejects integers beyond 64 bits, documents holding such values
+        are encoded with `json`, so the payload does not depend on whether
+        `orjson` is installed.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of the modeller.
+        """
+        document = self.to_json()
+        if orjson is not None and not _has_non_finite(document):
+            try:
+                return orjson.dumps(document)  # pylint: disable=no-member
+            except TypeError:
+                pass
+        return json.dumps(document).encode("utf-8")
+
+    def dump(self, fp) -> None:
+        """
+        Serialize the modeller and its components as JSON into a text file-like object.
+
+        The document is encoded in a single pass by `dumps`, then written at once.
+
+        Args:
+            fp: A text file-like object supporting `write`.
+        """
+        fp.write(self.dumps().decode("utf-8"))
@@ -1,38 +1,59 @@
 """Specific Constraints Module
 
-This module defines specific constraint classes that represent constraints for minimizing
-and maximizing specific variables.
+This module defines the specific constraint class that represents an objective of
+minimizing or maximizing a specific variable.
 
 Classes:
-    SpecificMinimum: Represents a constraint to minimize a specific variable.
-    SpecificMaximum: Represents a constraint to maximize a specific variable.
+    SpecificObjective: Represents a constraint to minimize or maximize a specific variable.
+
+Functions:
+    SpecificMinimum: Builds a SpecificObjective minimizing a specific variable.
+    SpecificMaximum: Builds a SpecificObjective maximizing a specific variable.
 
 """
+from qaekwy.exception.model_failure import ModelFailure
 from qaekwy.model.constraint.abstract_constraint import AbstractConstraint
 from qaekwy.model.variable.variable import Variable
 
+MINIMIZE = 0
+MAXIMIZE = 1
+
 
-class SpecificMinimum(AbstractConstraint):
+class SpecificObjective(AbstractConstraint):
     """
-    Represents a constraint to minimize a specific variable.
+    Represents a constraint to minimize or maximize a specific variable.
 
-    The SpecificMinimum class defines a constraint that aims to minimize the value
-    of a specific variable.
+    The SpecificObjective class defines a constraint that aims to minimize
+    (direction MINIMIZE) or maximize (direction MAXIMIZE) the value of a
+    specific variable.
 
     It inherits from the AbstractConstraint class and provides a method to convert the constraint
     to a JSON representation suitable for serialization.
 
     Args:
-        variable (Variable): The variable to be minimized.
+        variable (Variable): The variable to be optimized.
+        direction (int): MINIMIZE or MAXIMIZE.
         constraint_name (str, optional): The name of the constraint.
 
+    Raises:
+        ModelFailure: If the direction is neither MINIMIZE nor MAXIMIZE.
+
     Example:
-        specific_min = SpecificMinimum(my_variable, "minimize_constraint")
+        specific_max = SpecificObjective(my_variable, MAXIMIZE, "maximize_constraint")
     """
 
-    def __init__(self, variable: Variable, constraint_name=None) -> None:
+    __slots__ = ("variable", "direction")
+
+    _DIRECTION = ("minimize", "maximize")
+
+    def __init__(self, variable: Variable, direction: int, constraint_name=None) -> None:
+        if not isinstance(direction, int) or direction not in (MINIMIZE, MAXIMIZE):
+            raise ModelFailure(
+                f"The direction of an objective must be MINIMIZE or MAXIMIZE, not {direction!r}."
+            )
         super().__init__(constraint_name)
         self.variable = variable
+        self.direction = direction
 
     def to_json(self):
         """
@@ -41,36 +62,42 @@ class SpecificMinimum(AbstractConstraint):
         Returns:
             dict: A JSON representation of the constraint.
         """
-        return {"var": self.variable.var_name, "type": "minimize"}
+        return {"var": self.variable.var_name, "type": self._DIRECTION[self.direction]}
 
 
-class SpecificMaximum(AbstractConstraint):
+def SpecificMinimum(  # pylint: disable=invalid-name
+    variable: Variable, constraint_name=None
+) -> SpecificObjective:
     """
-    Represents a constraint to maximize a specific variable.
+    Create a constraint to minimize a specific variable.
+
+    Args:
+        variable (Variable): The variable to be minimized.
+        constraint_name (str, optional): The name of the constraint.
 
-    The SpecificMaximum class defines a constraint that aims to maximize the value
-    of a specific variable.
+    Returns:
+        SpecificObjective: The minimization objective.
 
-    It inherits from the AbstractConstraint class and provides a method to convert the constraint
-    to a JSON representation suitable for serialization.
+    Example:
+        specific_min = SpecificMinimum(my_variable, "minimize_constraint")
+    """
+    return SpecificObjective(variable, MINIMIZE, constraint_name)
+
+
+def SpecificMaximum(  # pylint: disable=invalid-name
+    variable: Variable, constraint_name=None
+) -> SpecificObjective:
+    """
+    Create a constraint to maximize a specific variable.
 
     Args:
         variable (Variable): The variable to be maximized.
         constraint_name (str, optional): The name of the constraint.
 
+    Returns:
+        SpecificObjective: The maximization objective.
+
     Example:
         specific_max = SpecificMaximum(my_variable, "maximize_constraint")
     """
-
-    def __init__(self, variable: Variable, constraint_name=None) -> None:
-        super().__init__(constraint_name)
-        self.variable = variable
-
-    def to_json(self):
-        """
-        Converts the constraint to a JSON representation.
-
-        Returns:
-            dict: A JSON representation of the constraint.
-        """
-        return {"var": self.variable.var_name, "type": "maximize"}
+    return SpecificObjective(variable, MAXIMIZE, constraint_name)
@@ -31,6 +31,8 @@ class BooleanVariable(Variable):  # pylint: disable=too-few-public-methods
         my_bool_var = BooleanVariable("b1", branch_val=BranchVal.VAL_MIN)
     """
 
+    __slots__ = ()
+
     def __init__(self, var_name: str, branch_val: BranchVal) -> None:
         super().__init__(var_name, 0, 1, VariableType.BOOLEAN, branch_val)
 
@@ -56,6 +58,8 @@ class BooleanExpressionVariable(
             BooleanExpressionVariable("b2", expression=expr, branch_val=BranchVal.VAL_MID)
     """
 
+    __slots__ = ()
+
     def __init__(self, var_name: str, expression: str, branch_val: BranchVal) -> None:
         super().__init__(var_name, expression, VariableType.BOOLEAN, branch_val)
 
@@ -77,6 +81,8 @@ class BooleanVariableArray(ArrayVariable):  # pylint: disable=too-few-public-met
                                              branch_val=BranchVal.VAL_RND)
     """
 
+    __slots__ = ()
+
     def __init__(
         self, var_name: str, length: int, branch_var: BranchVar, branch_val: BranchVal
     ) -> None:
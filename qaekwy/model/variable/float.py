@@ -41,6 +41,8 @@ class FloatVariable(Variable):  # pylint: disable=too-few-public-methods
             FloatVariable("x", domain_low=0.0, domain_high=1.0, branch_val=BranchFloatVal.VAL_RND)
     """
 
+    __slots__ = ()
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         var_name: str,
@@ -79,6 +81,8 @@ class FloatExpressionVariable(
                                                     branch_val=BranchFloatVal.VAL_MID)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         var_name: str,
@@ -107,6 +111,8 @@ class FloatVariableArray(ArrayVariable):
                                             branch_var=BranchFloatVar.VAR_RND)
     """
 
+    __slots__ = ()
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         var_name: str,
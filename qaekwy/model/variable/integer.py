@@ -42,6 +42,8 @@ class IntegerVariable(Variable):  # pylint: disable=too-few-public-methods
             IntegerVariable("x", domain_low=1, domain_high=10, branch_val=BranchIntegerVal.VAL_RND)
     """
 
+    __slots__ = ()
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         var_name: str,
@@ -80,6 +82,8 @@ class IntegerExpressionVariable(
                                                         branch_val=BranchIntegerVal.VAL_MID)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         var_name: str,
@@ -109,6 +113,8 @@ class IntegerVariableArray(ArrayVariable):
                                                 branch_var=BranchIntegerVar.VAR_MAX)
     """
 
+    __slots__ = ()
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         var_name: str,
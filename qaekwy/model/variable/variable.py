@@ -21,6 +21,13 @@ from qaekwy.model.variable.branch import (
     BranchVar,
 )
 
+# Optional domain entries of the JSON representation: (key, attribute).
+_OPTIONAL_JSON = (
+    ("domlow", "domain_low"),
+    ("domup", "domain_high"),
+    ("specific_domain", "specific_domain"),
+)
+
 
 class VariableType(Enum):
     """
@@ -51,79 +58,164 @@ class VariableType(Enum):
 
 
 class Expression:  # pylint: disable=missing-class-docstring
+    __slots__ = ("_value", "_parts")
+
+    # `==` builds an equality Expression instead of comparing, so expressions
+    # hash by identity; use `structural_eq` to compare two expressions.
+    __hash__ = object.__hash__
+
     def __init__(self, expr):
-        self.expr = expr
+        self._value = expr
+        self._parts = None
+
+    @classmethod
+    def compose(cls, *parts) -> "Expression":
+        """
+        Create an Expression from a sequence of parts, without formatting it.
+
+        Operands and already formatted expressions are converted to text right
+        away, so later changes to them do not affect the composed expression.
+        Composed sub-expressions are only referenced through their immutable
+        parts, and everything is joined into a string when the expression is
+        first read, in a single pass. Nesting expressions therefore never
+        copies their text over and over.
+
+        Args:
+            *parts: The parts of the expression, in order.
+
+        Returns:
+            Expression: The composed expression.
+        """
+        expression = cls.__new__(cls)
+        expression._value = None
+        expression._parts = tuple(map(_snapshot, parts))
+        return expression
+
+    @property
+    def expr(self):
+        """
+        The value of the expression, formatted on first access for composed expressions.
+        """
+        if self._parts is not None:
+            self._value = self._materialize()
+            self._parts = None
+        return self._value
+
+    @expr.setter
+    def expr(self, expr):
+        self._value = expr
+        self._parts = None
+
+    def structural_eq(self, other) -> bool:
+        """
+        Check whether another expression is of the same type and has the same value.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            bool: True if both expressions are structurally equal, False otherwise.
+        """
+        return type(self) is type(other) and self.expr == other.expr
+
+    def _materialize(self) -> str:
+        fragments = []
+        stack = [iter(self._parts)]
+        while stack:
+            for part in stack[-1]:
+                if part.__class__ is tuple:
+                    stack.append(iter(part))
+                    break
+                fragments.append(part)
+            else:
+                stack.pop()
+        return "".join(fragments)
 
     def __add__(self, expr):
-        return Expression(f"({self.expr} + {expr})")
+        return Expression.compose("(", self, " + ", expr, ")")
 
     def __radd__(self, expr):
-        return Expression(f"({expr} + {self.expr})")
+        return Expression.compose("(", expr, " + ", self, ")")
 
     def __sub__(self, expr):
-        return Expression(f"({self.expr} - {expr})")
+        return Expression.compose("(", self, " - ", expr, ")")
 
     def __rsub__(self, expr):
-        return Expression(f"({expr} - {self.expr})")
+        return Expression.compose("(", expr, " - ", self, ")")
 
     def __mul__(self, expr):
-        return Expression(f"{self.expr} * {expr}")
+        return Expression.compose(self, " * ", expr)
 
     def __rmul__(self, expr):
-        return Expression(f"{expr} * {self.expr}")
+        return Expression.compose(expr, " * ", self)
 
     def __truediv__(self, expr):
-        return Expression(f"(({self.expr}) / ({expr}))")
+        return Expression.compose("((", self, ") / (", expr, "))")
 
     def __rtruediv__(self, expr):
-        return Expression(f"(({expr}) / ({self.expr}))")
+        return Expression.compose("((", expr, ") / (", self, "))")
 
     def __mod__(self, expr):
-        return Expression(f"(({self.expr}) % ({expr}))")
+        return Expression.compose("((", self, ") % (", expr, "))")
 
     def __rmod__(self, expr):
-        return Expression(f"(({expr}) % ({self.expr}))")
+        return Expression.compose("((", expr, ") % (", self, "))")
 
     def __or__(self, expr):
-        return Expression(f"({self.expr} | {expr})")
+        return Expression.compose("(", self, " | ", expr, ")")
 
     def __ror__(self, expr):
-        return Expression(f"({expr} | {self.expr})")
+        return Expression.compose("(", expr, " | ", self, ")")
 
     def __and__(self, expr):
-        return Expression(f"{self.expr} & {expr}")
+        return Expression.compose(self, " & ", expr)
 
     def __rand__(self, expr):
-        return Expression(f"{expr} & {self.expr}")
+        return Expression.compose(expr, " & ", self)
 
     def __eq__(self, expr):
-        return Expression(f"(({self.expr}) == ({expr}))")
+        return Expression.compose("((", self, ") == (", expr, "))")
 
     def __ne__(self, expr):
-        return Expression(f"(({self.expr}) != ({expr}))")
+        return Expression.compose("((", self, ") != (", expr, "))")
 
     def __xor__(self, expr):
-        return Expression(f"(({self.expr}) ^ ({expr}))")
+        return Expression.compose("((", self, ") ^ (", expr, "))")
 
     def __neg__(self):
-        return Expression(f"!({self.expr})")
+        return Expression.compose("!(", self, ")")
 
     def __lt__(self, expr):
-        return Expression(f"(({self.expr}) < ({expr}))")
+        return Expression.compose("((", self, ") < (", expr, "))")
 
     def __le__(self, expr):
-        return Expression(f"(({self.expr}) <= ({expr}))")
+        return Expression.compose("((", self, ") <= (", expr, "))")
 
     def __gt__(self, expr):
-        return Expression(f"(({self.expr}) > ({expr}))")
+        return Expression.compose("((", self, ") > (", expr, "))")
 
     def __ge__(self, expr):
-        return Expression(f"(({self.expr}) >= ({expr}))")
+        return Expression.compose("((", self, ") >= (", expr, "))")
 
     def __str__(self):
         return str(self.expr)
 
 
+def _snapshot(part):
+    """
+    Return the part of a composed expression to store for an operand: the
+    parts of a composed expression, or the current text of anything else.
+    """
+    if part.__class__ is str:
+        return part
+    if isinstance(part, Expression):
+        # pylint: disable=protected-access
+        if part._parts is not None:
+            return part._parts
+        part = part._value
+    return str(part)
+
+
 class ExpressionArray:  # pylint: disable=missing-class-docstring
     """
     ExpressionArray class represents an array of expressions used for constructing expressions
@@ -152,6 +244,8 @@ class ExpressionArray:  # pylint: disable=missing-class-docstring
 
     """
 
+    __slots__ = ("array_name",)
+
     def __init__(self, array_name: str) -> None:
         """
         Initialize an ExpressionArray instance.
@@ -261,7 +355,19 @@ class ArrayVariable(ExpressionArray):  # pylint: disable=too-many-instance-attri
                 domain_low=0.0, domain_high=1.0)
     """
 
-    def __init__(  # pylint: disable=too-many-arguments
+    __slots__ = (
+        "var_name",
+        "var_type",
+        "length",
+        "domain_low",
+        "domain_high",
+        "specific_domain",
+        "branch_var",
+        "branch_val",
+        "branching_order",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments,super-init-not-called
         self,
         var_name: str,
         length: int,
@@ -272,7 +378,8 @@ class ArrayVariable(ExpressionArray):  # pylint: disable=too-many-instance-attri
         branch_var: BranchVar = BranchIntegerVar.VAR_RND,
         branch_val: BranchVal = BranchIntegerVal.VAL_RND,
     ) -> None:
-        super().__init__(var_name)
+        # ExpressionArray.__init__ is inlined: it only sets array_name.
+        self.array_name = var_name
         self.var_name = var_name
         self.var_type = var_type
         self.length = length
@@ -314,14 +421,10 @@ class ArrayVariable(ExpressionArray):  # pylint: disable=too-many-instance-attri
             "brancher_value": self.branch_val.value,
         }
 
-        if self.domain_low is not None:
-            data_json["domlow"] = self.domain_low
-
-        if self.domain_high is not None:
-            data_json["domup"] = self.domain_high
-
-        if self.specific_domain is not None:
-            data_json["specific_domain"] = self.specific_domain
+        for key, attribute in _OPTIONAL_JSON:
+            value = getattr(self, attribute)
+            if value is not None:
+                data_json[key] = value
 
         return data_json
 
@@ -348,7 +451,18 @@ class Variable(Expression):  # pylint: disable=too-few-public-methods
                                branch_val=BranchIntegerVal.VAL_RND)
     """
 
-    def __init__(  # pylint: disable=too-many-arguments
+    __slots__ = (
+        "var_name",
+        "var_type",
+        "domain_low",
+        "domain_high",
+        "specific_domain",
+        "branch_val",
+        "expression",
+        "branching_order",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments,super-init-not-called
         self,
         var_name: str,
         domain_low: Optional[int] = None,
@@ -357,7 +471,9 @@ class Variable(Expression):  # pylint: disable=too-few-public-methods
         var_type: VariableType = VariableType.INTEGER,
         branch_val: BranchVal = BranchIntegerVal.VAL_RND,
     ) -> None:
-        super().__init__(var_name)
+        # Expression.__init__ is inlined: it only sets _value and _parts.
+        self._value = var_name
+        self._parts = None
         self.var_name = var_name
         self.var_type = var_type
         self.domain_low = domain_low
@@ -398,14 +514,10 @@ class Variable(Expression):  # pylint: disable=too-few-public-methods
             data_json["expr"] = str(self.expression)
 
         else:
-            if self.domain_low is not None:
-                data_json["domlow"] = self.domain_low
-
-            if self.domain_high is not None:
-                data_json["domup"] = self.domain_high
-
-            if self.specific_domain is not None:
-                data_json["specific_domain"] = self.specific_domain
+            for key, attribute in _OPTIONAL_JSON:
+                value = getattr(self, attribute)
+                if value is not None:
+                    data_json[key] = value
 
         return data_json
 
@@ -431,6 +543,8 @@ class ExpressionVariable(Variable):  # pylint: disable=too-few-public-methods
                                               branch_val=BranchIntegerVal.VAL_RND)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         var_name: str,
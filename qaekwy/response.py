@@ -42,6 +42,12 @@ Note:
 from abc import ABC
 from typing import List
 import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from qaekwy.explanation import Explanation
 
 from qaekwy.solution import Solution
@@ -426,7 +432,11 @@ class ClusterStatusResponse:  # pylint: disable=too-few-public-methods
             the optimization engine.
         """
         node_status_list = []
-        j = json.loads(response_content)
+        j = (
+            orjson.loads(response_content)  # pylint: disable=no-member
+            if orjson is not None
+            else json.loads(response_content)
+        )
 
         if isinstance(j, list):
             for node in j:
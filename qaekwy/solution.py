@@ -7,6 +7,10 @@ Classes:
 
 """
 
+# Names of the dict methods, which a variable of the same name shadows when
+# read as an attribute.
+_DICT_METHODS = frozenset(name for name in dir(dict) if not name.startswith("__"))
+
 
 class Solution(dict):
     """
@@ -36,29 +40,57 @@ class Solution(dict):
         z_value = solution.z  # z_value is None
     """
 
+    __slots__ = ()
+
+    def __new__(cls, solution_json_content: list = ()):
+        # Only solutions with a variable named after a dict method need an
+        # instance __dict__, to bind these variables over the methods.
+        if cls is Solution and any(
+            element["name"] in _DICT_METHODS for element in solution_json_content
+        ):
+            return super().__new__(_ShadowingSolution)
+        return super().__new__(cls)
+
     def __init__(self, solution_json_content: list) -> None:
-        self.solution_json_content = solution_json_content
+        # Size the positioned variables first, so that each list is allocated once.
+        sizes = {}
+        for element in solution_json_content:
+            if "position" in element:
+                variable = element["name"]
+                sizes[variable] = max(sizes.get(variable, 0), element["position"] + 1)
 
-        for element in self.solution_json_content:
+        for element in solution_json_content:
             variable = element["name"]
 
-            if element["assigned"] is True:
-                val = element["value"]
-            else:
-                val = None
+            val = element["value"] if element["assigned"] else None
 
             if "position" in element:
                 position = element["position"]
                 if variable not in self:
-                    self[variable] = []
-
-                while len(self[variable]) < position + 1:
-                    self[variable].append(None)
+                    self[variable] = [None] * sizes[variable]
 
                 self[variable][position] = val
 
             else:
                 self[variable] = val
 
-        for elem in self.items():
-            self.__setattr__(elem[0], elem[1])
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class _ShadowingSolution(Solution):
+    """
+    Solution holding variables named after dict methods.
+
+    __getattr__ is only reached when the regular lookup fails, so these
+    variables are bound on the instance, where they take precedence over the
+    methods of the same name.
+    """
+
+    def __init__(self, solution_json_content: list) -> None:
+        super().__init__(solution_json_content)
+        for variable in _DICT_METHODS.intersection(self):
+            self.__dict__[variable] = self[variable]
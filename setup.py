@@ -43,6 +43,11 @@ setup(
         "qaekwy.model.constraint",
         "qaekwy.exception",
     ],
+    extras_require={
+        "numba": ["numpy", "numba"],
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
+    },
     project_urls={
         'Homepage': 'https://qaekwy.io',
         'Documentation': 'https://docs.qaekwy.io',
@@ -25,5 +25,16 @@ class TestConstraintMember(unittest.TestCase):
         }
         self.assertEqual(constraint.to_json(), expected_json)
 
+    def test_constraint_check(self):
+        constraint = ConstraintMember(self.array_variable, self.variable_to_check)
+        self.assertTrue(constraint.check([4, 1, 3], 3))
+        self.assertFalse(constraint.check([4, 1, 3], 2))
+
+    def test_constraint_check_sorted(self):
+        constraint = ConstraintMember(self.array_variable, self.variable_to_check)
+        self.assertTrue(constraint.check([1, 3, 4], 4, assume_sorted=True))
+        self.assertFalse(constraint.check([1, 3, 4], 5, assume_sorted=True))
+        self.assertFalse(constraint.check([1, 3, 4], 2, assume_sorted=True))
+
 if __name__ == '__main__':
     unittest.main()
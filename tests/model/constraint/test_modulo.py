@@ -2,6 +2,8 @@
 
 import unittest
 
+from qaekwy.exception.model_failure import ModelFailure
+from qaekwy.model.variable.float import FloatVariable
 from qaekwy.model.variable.integer import IntegerVariable
 from qaekwy.model.constraint.modulo import ConstraintModulo
 
@@ -40,5 +42,22 @@ class TestConstraintModulo(unittest.TestCase):
         }
         self.assertEqual(constraint.to_json(), expected_json)
 
+    def test_unsatisfiable_domain(self):
+        dividend = IntegerVariable("dividend", 0, 10)
+        divisor = IntegerVariable("divisor", 1, 5)
+        result = IntegerVariable("result", 5, 10)
+        with self.assertRaises(ModelFailure):
+            ConstraintModulo(dividend, divisor, result)
+
+    def test_float_domain(self):
+        dividend = FloatVariable("dividend", 0, 10)
+        divisor = FloatVariable("divisor", 1.5, 1.5)
+        result = FloatVariable("result", 1.0, 1.4)
+        constraint = ConstraintModulo(dividend, divisor, result)
+        self.assertEqual(constraint.var_3, result)
+
+        with self.assertRaises(ModelFailure):
+            ConstraintModulo(dividend, divisor, FloatVariable("result", 1.6, 2.0))
+
 if __name__ == '__main__':
     unittest.main()
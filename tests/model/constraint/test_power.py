@@ -2,6 +2,7 @@
 
 import unittest
 
+from qaekwy.exception.model_failure import ModelFailure
 from qaekwy.model.variable.integer import IntegerVariable
 from qaekwy.model.constraint.power import ConstraintPower
 
@@ -40,5 +41,11 @@ class TestConstraintPower(unittest.TestCase):
         }
         self.assertEqual(constraint.to_json(), expected_json)
 
+    def test_unsatisfiable_domain(self):
+        base = IntegerVariable("base", 0, 3)
+        result = IntegerVariable("result", 10, 20)
+        with self.assertRaises(ModelFailure):
+            ConstraintPower(base, 2, result)
+
 if __name__ == '__main__':
     unittest.main()
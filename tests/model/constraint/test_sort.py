@@ -3,7 +3,11 @@
 import unittest
 
 from qaekwy.model.variable.integer import IntegerVariableArray
-from qaekwy.model.constraint.sort import ConstraintSorted, ConstraintReverseSorted
+from qaekwy.model.constraint.sort import (
+    ConstraintOrder,
+    ConstraintSorted,
+    ConstraintReverseSorted,
+)
 
 
 class TestConstraintSorted(unittest.TestCase):
@@ -49,5 +53,56 @@ class TestConstraintReverseSorted(unittest.TestCase):
         
         self.assertEqual(reverse_sorted_constraint.to_json(), expected_json)
 
+
+class TestConstraintOrder(unittest.TestCase):
+
+    def test_order_constraint_defaults_to_ascending(self):
+        array_var = IntegerVariableArray("array_var", 10, 0, 200)
+        order_constraint = ConstraintOrder(array_var, constraint_name="order_constraint")
+
+        self.assertFalse(order_constraint.reverse)
+        self.assertEqual(order_constraint.to_json()["type"], "sorted")
+
+    def test_order_constraint_reverse(self):
+        array_var = IntegerVariableArray("array_var", 10, 0, 200)
+        order_constraint = ConstraintOrder(array_var, reverse=True)
+
+        self.assertTrue(order_constraint.reverse)
+        self.assertEqual(order_constraint.to_json()["type"], "rsorted")
+
+    def test_factories_return_order_constraint(self):
+        array_var = IntegerVariableArray("array_var", 10, 0, 200)
+
+        self.assertIsInstance(ConstraintSorted(array_var), ConstraintOrder)
+        self.assertIsInstance(ConstraintReverseSorted(array_var), ConstraintOrder)
+
+    def test_check_ascending(self):
+        array_var = IntegerVariableArray("array_var", 4, 0, 200)
+        order_constraint = ConstraintSorted(array_var)
+
+        self.assertTrue(order_constraint.check([1, 2, 2, 5]))
+        self.assertFalse(order_constraint.check([1, 3, 2, 5]))
+        self.assertTrue(order_constraint.check([]))
+
+    def test_check_descending(self):
+        array_var = IntegerVariableArray("array_var", 4, 0, 200)
+        order_constraint = ConstraintReverseSorted(array_var)
+
+        self.assertTrue(order_constraint.check([5, 2, 2, 1]))
+        self.assertFalse(order_constraint.check([5, 2, 3, 1]))
+
+    def test_check_large_integers(self):
+        array_var = IntegerVariableArray("array_var", 2, 0, 200)
+
+        self.assertFalse(ConstraintSorted(array_var).check([2**70, 1]))
+        self.assertTrue(ConstraintReverseSorted(array_var).check([2**70, 1]))
+
+    def test_check_unassigned_values(self):
+        array_var = IntegerVariableArray("array_var", 3, 0, 200)
+        order_constraint = ConstraintSorted(array_var)
+
+        with self.assertRaises(TypeError):
+            order_constraint.check([1, None, 3])
+
 if __name__ == '__main__':
     unittest.main()
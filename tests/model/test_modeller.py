@@ -1,11 +1,20 @@
 # pylint: skip-file
 
+import io
+import json
 import unittest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from qaekwy.model.constraint.abs import ConstraintAbs
 from qaekwy.model.modeller import Modeller
 from qaekwy.model.specific import SpecificMinimum
 from qaekwy.model.searcher import SearcherType
-from qaekwy.model.cutoff import CutoffFibonacci
+from qaekwy.model.cutoff import CutoffFibonacci, CutoffGeometric
+from qaekwy.model.variable.float import FloatVariable
 from qaekwy.model.variable.integer import IntegerVariable
 
 class TestModeller(unittest.TestCase):
@@ -32,6 +41,12 @@ class TestModeller(unittest.TestCase):
         self.modeller.add_objective(self.objective)
         self.assertEqual(self.modeller.objective_list, [self.objective])
 
+    def test_add_none_is_ignored(self):
+        self.modeller.add_variable(None).add_constraint(None).add_objective(None)
+        self.assertEqual(self.modeller.variable_list, [])
+        self.assertEqual(self.modeller.constraint_list, [])
+        self.assertEqual(self.modeller.objective_list, [])
+
     def test_set_searcher(self):
         self.modeller.set_searcher(self.searcher)
         self.assertEqual(self.modeller.searcher, self.searcher)
@@ -64,5 +79,71 @@ class TestModeller(unittest.TestCase):
 
         self.assertEqual(self.modeller.to_json(), expected_json)
 
+    def test_dumps(self):
+        self.modeller.add_variable(self.var1).add_constraint(self.constraint).add_objective(self.objective)
+        self.modeller.set_searcher(self.searcher).set_cutoff(self.cutoff)
+
+        payload = self.modeller.dumps()
+
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(json.loads(payload), self.modeller.to_json())
+
+    def test_dump(self):
+        self.modeller.add_variable(self.var1).add_constraint(self.constraint).add_objective(self.objective)
+        self.modeller.set_searcher(self.searcher).set_cutoff(self.cutoff)
+
+        buffer = io.StringIO()
+        self.modeller.dump(buffer)
+
+        self.assertEqual(json.loads(buffer.getvalue()), self.modeller.to_json())
+
+    def test_to_json_edits_do_not_leak(self):
+        self.modeller.add_variable(self.var1).set_searcher(self.searcher)
+        self.modeller.dumps()
+
+        self.modeller.to_json()["var"][0]["domup"] = 1000
+
+        self.assertEqual(self.modeller.to_json()["var"][0]["domup"], 10)
+        self.assertEqual(json.loads(self.modeller.dumps())["var"][0]["domup"], 10)
+
+    def test_dumps_after_direct_assignment(self):
+        self.modeller.add_variable(self.var1).add_constraint(self.constraint)
+        self.modeller.set_searcher(self.searcher)
+        self.modeller.dumps()
+
+        self.var1.domain_high = 20
+        self.var1.var_name = "renamed"
+
+        payload = json.loads(self.modeller.dumps())
+        self.assertEqual(payload["var"][0]["domup"], 20)
+        self.assertEqual(payload["var"][0]["name"], "renamed")
+        self.assertEqual(payload["constraint"][0]["v1"], "renamed")
+
+    def test_dumps_matches_json(self):
+        self.modeller.set_searcher(self.searcher)
+        self.modeller.add_variable(FloatVariable("inf", float("-inf"), float("inf")))
+        self.modeller.add_variable(IntegerVariable("big", 0, 2**70))
+
+        self.assertEqual(
+            self.modeller.dumps(),
+            json.dumps(self.modeller.to_json()).encode("utf-8"),
+        )
+
+    def test_dumps_nested_non_finite(self):
+        self.modeller.add_variable(self.var1).set_searcher(self.searcher)
+        self.modeller.set_cutoff(CutoffGeometric(float("nan"), 1))
+
+        self.assertEqual(
+            self.modeller.dumps(),
+            json.dumps(self.modeller.to_json()).encode("utf-8"),
+        )
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_dumps_null_name_uses_orjson(self):
+        self.modeller.add_variable(IntegerVariable("nullable_x", 0, 10))
+        self.modeller.set_searcher(self.searcher)
+
+        self.assertEqual(self.modeller.dumps(), orjson.dumps(self.modeller.to_json()))
+
 if __name__ == '__main__':
     unittest.main()
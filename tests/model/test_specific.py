@@ -0,0 +1,40 @@
+# pylint: skip-file
+
+import unittest
+
+from qaekwy.exception.model_failure import ModelFailure
+from qaekwy.model.specific import (
+    MAXIMIZE,
+    MINIMIZE,
+    SpecificMaximum,
+    SpecificMinimum,
+    SpecificObjective,
+)
+from qaekwy.model.variable.integer import IntegerVariable
+
+
+class TestSpecificObjective(unittest.TestCase):
+
+    def setUp(self):
+        self.variable = IntegerVariable("x", 0, 10)
+
+    def test_minimum_to_json(self):
+        objective = SpecificMinimum(self.variable)
+        self.assertIsInstance(objective, SpecificObjective)
+        self.assertEqual(objective.direction, MINIMIZE)
+        self.assertEqual(objective.to_json(), {"var": "x", "type": "minimize"})
+
+    def test_maximum_to_json(self):
+        objective = SpecificMaximum(self.variable, "maximize_x")
+        self.assertIsInstance(objective, SpecificObjective)
+        self.assertEqual(objective.direction, MAXIMIZE)
+        self.assertEqual(objective.constraint_name, "maximize_x")
+        self.assertEqual(objective.to_json(), {"var": "x", "type": "maximize"})
+
+    def test_invalid_direction(self):
+        for direction in (-1, 2, 1.0, None):
+            with self.assertRaises(ModelFailure):
+                SpecificObjective(self.variable, direction)
+
+if __name__ == '__main__':
+    unittest.main()
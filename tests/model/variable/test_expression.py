@@ -41,5 +41,42 @@ class TestExpression(unittest.TestCase):
         self.assertEqual(str(expr > 4), "((5) > (4))")
         self.assertEqual(str(expr >= 4), "((5) >= (4))")
 
+    def test_nested_expression(self):
+        shared = Expression("x") + 1
+        expr = Expression("y")
+        for _ in range(5000):
+            expr = expr + shared
+
+        self.assertTrue(str(expr).startswith("((((("))
+        self.assertTrue(str(expr).endswith(" + (x + 1))"))
+        self.assertEqual(str(expr * shared), f"{expr} * (x + 1)")
+        self.assertEqual(str(shared), "(x + 1)")
+
+    def test_operands_are_captured_at_composition(self):
+        leaf = Expression("a")
+        composed = leaf + 1
+        leaf.expr = "b"
+        self.assertEqual(str(composed), "(a + 1)")
+
+        values = [1, 2]
+        composed = Expression("x") + values
+        values.append(3)
+        self.assertEqual(str(composed), "(x + [1, 2])")
+
+        inner = Expression("y") - 1
+        outer = inner * 2
+        inner.expr = "z"
+        self.assertEqual(str(outer), "(y - 1) * 2")
+
+    def test_hash_and_structural_eq(self):
+        expr1 = Expression("x") + 1
+        expr2 = Expression("x") + 1
+
+        self.assertEqual(len({expr1, expr2, expr1}), 2)
+        self.assertEqual({expr1: "a"}[expr1], "a")
+        self.assertTrue(expr1.structural_eq(expr2))
+        self.assertFalse(expr1.structural_eq(Expression("x") + 2))
+        self.assertFalse(expr1.structural_eq("(x + 1)"))
+
 if __name__ == '__main__':
     unittest.main()
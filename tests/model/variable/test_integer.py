@@ -2,7 +2,7 @@
 
 import unittest
 
-from qaekwy.model.variable.integer import IntegerVariable
+from qaekwy.model.variable.integer import IntegerVariable, IntegerVariableArray
 from qaekwy.model.variable.variable import Expression
 
 class TestExpression(unittest.TestCase):
@@ -69,6 +69,10 @@ class TestIntegerVariable(unittest.TestCase):
         self.assertEqual(int_var_json["domlow"], 1)
         self.assertEqual(int_var_json["domup"], 5)
 
+    def test_integer_variables_are_slotted(self):
+        self.assertFalse(hasattr(IntegerVariable("y"), "__dict__"))
+        self.assertFalse(hasattr(IntegerVariableArray("arr", 3), "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,6 +18,18 @@ class ExplanationTest(unittest.TestCase):
         self.assertEqual(explanation.get_constraints()["y"]["type"], "constraint")
         self.assertEqual(explanation.get_constraints()["y"]["explanation"], "y is a constraint")
 
+    def test_single_pass(self):
+        explanation_content = [
+            {"name": "x", "type": "var", "explanation": "x is a variable"},
+            {"name": "y", "type": "constraint", "explanation": "y is a constraint"},
+            {"name": "z", "type": "other", "explanation": "z is ignored"},
+        ]
+        explanation = Explanation(explanation_content)
+
+        self.assertEqual(list(explanation.get_variables()), ["x"])
+        self.assertEqual(list(explanation.get_constraints()), ["y"])
+        self.assertIs(explanation.get_variables(), explanation.get_variables())
+
     def test_missing_variable(self):
         explanation_content = [
             {"name": "y", "type": "constraint", "explanation": "y is a constraint"},
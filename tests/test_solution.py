@@ -38,6 +38,29 @@ class SolutionTest(unittest.TestCase):
         self.assertEqual(solution["y"][0], 10)
         self.assertEqual(solution["z"], None)
 
+    def test_positional_assignment_unordered(self):
+        solution_json_content = [
+            {"name": "x", "assigned": True, "value": 3, "position": 3},
+            {"name": "x", "assigned": True, "value": 0, "position": 0},
+            {"name": "x", "assigned": False, "value": None, "position": 1},
+        ]
+        solution = Solution(solution_json_content)
+
+        self.assertEqual(solution["x"], [0, None, None, 3])
+        self.assertEqual(solution.x, [0, None, None, 3])
+
+    def test_dict_method_names(self):
+        solution_json_content = [
+            {"name": "values", "assigned": True, "value": 3},
+            {"name": "items", "assigned": True, "value": 4, "position": 0},
+        ]
+        solution = Solution(solution_json_content)
+
+        self.assertIsInstance(solution, Solution)
+        self.assertEqual(solution.values, 3)
+        self.assertEqual(solution.items, [4])
+        self.assertEqual(solution.keys(), {"values": 3, "items": [4]}.keys())
+
     def test_missing_variable(self):
         solution_json_content = [
             {"name": "x", "assigned": True, "value": 5},
@@ -48,6 +71,12 @@ class SolutionTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             solution["z"]
 
+        with self.assertRaises(AttributeError):
+            solution.z
+
+        self.assertFalse(hasattr(solution, "z"))
+        self.assertFalse(hasattr(solution, "__dict__"))
+
     def test_invalid_position(self):
         solution_json_content = [
             {"name": "x", "assigned": True, "value": 5, "position": 1},